@@ -219,7 +219,8 @@ class GenotypeDtype(PandasExtensionDtype):
         return {k: getattr(self, k, None) for k in self._metadata}
 
     def __setstate__(self, state: MutableMapping[str, Any]) -> None:
-        self.variant = state.pop("variant")
+        # Re-initialize so that the record type is rebuilt for the variant
+        self.__init__(state.pop("variant"))
 
     # Other internal methods
     # ----------------------
@@ -417,6 +418,35 @@ class GenotypeArray(ExtensionArray, EncodingMixin, InfoMixin):
             [variant.make_genotype_from_str(s) for s in strings], dtype, copy
         )
 
+    @classmethod
+    def _from_allele_idxs(
+        cls,
+        allele_idxs: np.ndarray,
+        dtype: GenotypeDtype,
+        gt_scores: Optional[np.ndarray] = None,
+    ) -> "GenotypeArray":
+        """
+        Construct a new GenotypeArray directly from an array of allele indices,
+        without creating intermediate Genotype objects.
+
+        Parameters
+        ----------
+        allele_idxs : np.ndarray with shape (<genotypes>, <ploidy>)
+            Indices into the allele list of the dtype
+        dtype : GenotypeDtype
+            GenotypeDtype with variant information
+        gt_scores : np.ndarray with shape (<genotypes>,), optional
+            Genotype scores, missing (255) if not specified
+
+        Returns
+        -------
+        GenotypeArray
+        """
+        data = np.empty(len(allele_idxs), dtype=dtype._record_type)
+        data["allele_idxs"] = allele_idxs
+        data["gt_score"] = MISSING_IDX if gt_scores is None else gt_scores
+        return cls(values=data, dtype=dtype)
+
     @classmethod
     def _from_factorized(cls, values, original):
         """
@@ -1,5 +1,8 @@
+import copy
+import os
 from enum import Enum
-from typing import Optional, Tuple, Union
+from multiprocessing import Pool
+from typing import Iterator, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -8,7 +11,17 @@ import statsmodels.api as sm
 from numpy.random._generator import default_rng
 
 from pandas_genomics.arrays import GenotypeArray, GenotypeDtype
-from pandas_genomics.scalars import Variant, MISSING_IDX
+from pandas_genomics.scalars import Variant
+
+# Allele indices of each biallelic genotype: Homozygous Ref, Het, Homozygous Alt
+_GT_ALLELE_IDXS = np.array([(0, 0), (0, 1), (1, 1)], dtype=np.uint8)
+# Allele indices of each SNP for each genotype table cell, counted left to right (SNP1) then top to bottom (SNP2)
+_SNP1_ALLELE_IDXS = np.tile(_GT_ALLELE_IDXS, (3, 1))
+_SNP2_ALLELE_IDXS = np.repeat(_GT_ALLELE_IDXS, 3, axis=0)
+# Genotype table indices for cases followed by controls, expanded using the count of each
+_CASE_CONTROL_GT_TABLE_IDXS = np.tile(np.arange(9, dtype=np.uint8), 2)
+# Case/control outcomes are built directly from int8 codes (0=Case, 1=Control)
+_OUTCOME_DTYPE = pd.CategoricalDtype(["Case", "Control"])
 
 
 class SNPEffectEncodings(Enum):
@@ -22,6 +35,18 @@ class SNPEffectEncodings(Enum):
     HET = (0, 1, 0)
 
 
+def _get_effect_array(effect: SNPEffectEncodings, shape: Tuple[int, int]):
+    """Return a read-only array of the effect values with the given shape"""
+    arr = np.array(effect.value, dtype=float).reshape(shape)
+    arr.flags.writeable = False
+    return arr
+
+
+# Shared effect arrays for each encoding, shaped for SNP1 (columns) and SNP2 (rows)
+_EFF1_ARRAYS = {e: _get_effect_array(e, (1, 3)) for e in SNPEffectEncodings}
+_EFF2_ARRAYS = {e: _get_effect_array(e, (3, 1)) for e in SNPEffectEncodings}
+
+
 class PenetranceTables(Enum):
     """Enum: Penetrance Tables for Simple Models"""
 
@@ -36,6 +61,11 @@ class PenetranceTables(Enum):
     NULL = [0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5]  # Null Model (Always 50/50)
 
 
+# Default penetrance table, read-only since it is shared by every simulator using the default
+_DEFAULT_PEN_TABLE = np.array([[0.0, 0.0, 1.0], [0.0, 0.0, 1.0], [1.0, 1.0, 2.0]])
+_DEFAULT_PEN_TABLE.flags.writeable = False
+
+
 class BAMS:
     """
     Biallelic Model Simulator.  Used to simulate two SNPs with phenotype data based on a penetrance table.
@@ -45,9 +75,7 @@ class BAMS:
 
     def __init__(
         self,
-        pen_table: Union[np.array, PenetranceTables] = np.array(
-            [[0.0, 0.0, 1.0], [0.0, 0.0, 1.0], [1.0, 1.0, 2.0]]
-        ),
+        pen_table: Optional[Union[np.array, PenetranceTables]] = None,
         penetrance_base: float = 0.25,
         penetrance_diff: Optional[float] = None,
         snp1: Optional[Variant] = None,
@@ -57,8 +85,9 @@ class BAMS:
         """
         Parameters
         ----------
-        pen_table: 3x3 np array or PenetranceTables enum
+        pen_table: 3x3 np array or PenetranceTables enum, default None
             Penetrance values.  Will be scaled between 0 and 1 if needed.
+            If None, [[0, 0, 1], [0, 0, 1], [1, 1, 2]] is used.
         penetrance_base: float, default 0.25
             Baseline to use in the final penetrance table, must be in [0,1]
         penetrance_diff: optional float, default None (use 1-2*penetrance_base)
@@ -68,6 +97,8 @@ class BAMS:
         snp2: Optional[Variant]
         random_seed: int, default 1855
         """
+        if pen_table is None:
+            pen_table = _DEFAULT_PEN_TABLE
         pen_table, snp1, snp2 = self._validate_params(
             pen_table, penetrance_base, penetrance_diff, snp1, snp2
         )
@@ -77,6 +108,18 @@ class BAMS:
         self._random_seed = random_seed
         self.rng = default_rng(self._random_seed)
 
+        # Penetrance table scaled from 0 to 1, used when adjusting for SNR
+        pen_table_range = self.pen_table.max() - self.pen_table.min()
+        if pen_table_range > 0:
+            self._scaled_pen_table = (
+                self.pen_table - self.pen_table.min()
+            ) / pen_table_range
+        else:
+            self._scaled_pen_table = np.zeros_like(self.pen_table)
+
+        self._snp1_dtype = GenotypeDtype(self.snp1)
+        self._snp2_dtype = GenotypeDtype(self.snp2)
+
     def __str__(self):
         pen_table_df = pd.DataFrame(self.pen_table)
         pen_table_df.columns = self._get_genotype_strs(self.snp1)
@@ -220,14 +263,15 @@ class BAMS:
 
         """
         # TODO: Add more validation
-        if type(eff1) is SNPEffectEncodings:
-            eff1 = eff1.value
-        if type(eff2) is SNPEffectEncodings:
-            eff2 = eff2.value
-
-        # Shape effects and scale if needed
-        eff1 = np.array([eff1])  # SNP1 = columns
-        eff2 = np.array([eff2]).transpose()  # SNP2 = rows
+        # Shape effects (using the shared arrays for encodings) and scale if needed
+        if isinstance(eff1, SNPEffectEncodings):
+            eff1 = _EFF1_ARRAYS[eff1]
+        else:
+            eff1 = np.asarray(eff1, dtype=float).reshape(1, 3)  # SNP1 = columns
+        if isinstance(eff2, SNPEffectEncodings):
+            eff2 = _EFF2_ARRAYS[eff2]
+        else:
+            eff2 = np.asarray(eff2, dtype=float).reshape(3, 1)  # SNP2 = rows
         if eff1.min() != 0 or eff1.max() != 1:
             print("Scaling eff1")
             eff1 = (eff1 - eff1.min()) / (eff1.max() - eff1.min())
@@ -235,11 +279,8 @@ class BAMS:
             print("Scaling eff2")
             eff2 = (eff2 - eff2.min()) / (eff2.max() - eff2.min())
 
-        pen_table = (
-            +main1 * np.repeat(eff1, 3, axis=0)
-            + main2 * np.repeat(eff2, 3, axis=1)
-            + interaction * np.outer(eff2, eff1)
-        )
+        # Row and column effects broadcast against each other into the 3x3 table
+        pen_table = main1 * eff1 + main2 * eff2 + interaction * (eff2 * eff1)
 
         return cls(pen_table, penetrance_base, penetrance_diff, snp1, snp2, random_seed)
 
@@ -277,76 +318,233 @@ class BAMS:
                 "Simulation must include at least one case and at least one control"
             )
 
-        # Create table of Prob(GT) based on MAF, assuming HWE
-        prob_snp1 = np.array([(1 - maf1) ** 2, 2 * maf1 * (1 - maf1), (maf1) ** 2])
-        prob_snp2 = np.array(
-            [(1 - maf2) ** 2, 2 * maf2 * (1 - maf2), (maf2) ** 2]
-        ).transpose()
-        prob_gt = np.outer(prob_snp2, prob_snp1)
+        prob_gt_given_case, prob_gt_given_control = self._get_case_control_probs(
+            maf1, maf2, snr
+        )
+        return self._simulate_case_control(
+            n_cases, n_controls, prob_gt_given_case, prob_gt_given_control
+        )
 
-        pen_table = self.pen_table
-        if snr is not None:
-            # Scale penetrance table from 0 to 1
-            pen_table = (pen_table - pen_table.min()) / (
-                pen_table.max() - pen_table.min()
+    def iter_case_control_chunks(
+        self,
+        chunk_size: int = 100_000,
+        n_cases: int = 1000,
+        n_controls: int = 1000,
+        maf1: float = 0.30,
+        maf2: float = 0.30,
+        snr: Optional[float] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Simulate genotypes with the specified number of 'case' and 'control' phenotypes,
+        yielding them in chunks of at most `chunk_size` rows so that very large simulations
+        can be processed without holding all samples in memory at once.
+
+        Each chunk contains cases and controls in proportion to the totals.
+
+        Parameters
+        ----------
+        chunk_size: int, default 100,000
+            Maximum number of samples in each chunk
+        n_cases: int, default 1000
+        n_controls: int, default 1000
+        maf1: float, default 0.30
+            Minor Allele Frequency to use for SNP1
+        maf2: float, default 0.30
+            Minor Allele Frequency to use for SNP2
+        snr: float, default 1.0
+            Signal-to-noise ratio
+
+        Yields
+        ------
+        pd.Dataframe
+            Dataframe with 3 columns: Outcome (categorical), SNP1 (GenotypeArray), and SNP2 (GenotypeArray)
+
+        """
+        # Validate params
+        if n_cases < 1 or n_controls < 0:
+            raise ValueError(
+                "Simulation must include at least one case and at least one control"
             )
-            # Calcualte sigma
-            sigma = self._calculate_sigma(pen_table, prob_gt)
-            # Scale the penetrance by the amount of unexplained variance
-            # Odds Ratio = exp(SNP/Sigma)
-            min_p = 1 / (1 + np.exp(1 / sigma * snr))
-            p_diff = 1 - 2 * min_p
-            # Adjust the penetrance
-            pen_table = min_p + pen_table * p_diff
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
 
-        #                     P(Case|GT) * P(GT)
-        # Bayes: P(GT|Case) = ------------------
-        #                           P(Case)
+        # Probabilities are the same for every chunk
+        prob_gt_given_case, prob_gt_given_control = self._get_case_control_probs(
+            maf1, maf2, snr
+        )
 
-        # Prob(Case|GT) = pen_table
-        # Prob(Case) = sum(Prob(Case|GTi) * Prob(GTi) for each GT i)
-        prob_case = (pen_table * prob_gt).sum()
-        # Prob(GT|Case)
-        prob_gt_given_case = (pen_table * prob_gt) / prob_case
+        n_samples = n_cases + n_controls
+        for start in range(0, n_samples, chunk_size):
+            end = min(start + chunk_size, n_samples)
+            # Split cases proportionally so that the chunks add up to the totals
+            chunk_cases = (n_cases * end) // n_samples - (n_cases * start) // n_samples
+            yield self._simulate_case_control(
+                chunk_cases,
+                (end - start) - chunk_cases,
+                prob_gt_given_case,
+                prob_gt_given_control,
+            )
 
-        # Prob(Control|GT) = 1-pen_table
-        # Prob(Control) = sum(Prob(Control|GTi) * Prob(GTi) for each GT i)
-        prob_control = ((1 - pen_table) * prob_gt).sum()
-        # Prob(GT|Control)
-        prob_gt_given_control = ((1 - pen_table) * prob_gt) / prob_control
-
-        # Generate genotypes based on the simulated cases and controls
-        # Pick int index into the table (0 through 8) counted left to right then top to bottom (due to flatten())
-        case_gt_table_idxs = self.rng.choice(
-            range(9), size=n_cases, p=prob_gt_given_case.flatten()
+    def _simulate_case_control(
+        self, n_cases, n_controls, prob_gt_given_case, prob_gt_given_control
+    ):
+        """Simulate case and control genotypes given Prob(GT|Case) and Prob(GT|Control)"""
+        # Count how many of each index into the table (0 through 8, counted left to right then top to bottom)
+        # are drawn for cases and for controls
+        return self._get_case_control_df(
+            self.rng.multinomial(n_cases, prob_gt_given_case),
+            self.rng.multinomial(n_controls, prob_gt_given_control),
+        )
+
+    def _get_case_control_df(self, case_counts, control_counts):
+        """Assemble scrambled case and control samples from the count of each genotype table index"""
+        # Expand the counts into one index per sample, with cases followed by controls
+        # (uint8 indices keep the shuffle and lookups small)
+        gt_table_idxs = np.repeat(
+            _CASE_CONTROL_GT_TABLE_IDXS, np.concatenate([case_counts, control_counts])
         )
-        control_gt_table_idxs = self.rng.choice(
-            range(9), size=n_controls, p=prob_gt_given_control.flatten()
+
+        # Scramble the samples so cases and controls are mixed
+        n_cases = case_counts.sum()
+        perm = self.rng.permutation(len(gt_table_idxs))
+        gt_table_idxs = gt_table_idxs[perm]
+        snp1, snp2 = self._get_gt_arrays(gt_table_idxs)
+
+        # Generate outcome: cases are the samples that came from the first n_cases positions
+        outcome = pd.Categorical.from_codes(
+            (perm >= n_cases).astype(np.int8), dtype=_OUTCOME_DTYPE
         )
 
-        # Create GenotypeArrays
-        snp1_case_array = pd.Series(self._get_snp1_gt_array(case_gt_table_idxs))
-        snp2_case_array = pd.Series(self._get_snp2_gt_array(case_gt_table_idxs))
-        snp1_control_array = pd.Series(self._get_snp1_gt_array(control_gt_table_idxs))
-        snp2_control_array = pd.Series(self._get_snp2_gt_array(control_gt_table_idxs))
+        return pd.DataFrame({"Outcome": outcome, "SNP1": snp1, "SNP2": snp2})
+
+    def generate_case_control_grid(
+        self,
+        maf1: Sequence[float],
+        maf2: Sequence[float],
+        n_cases: int = 1000,
+        n_controls: int = 1000,
+        snr: Optional[float] = None,
+    ):
+        """
+        Simulate genotypes with the specified number of 'case' and 'control' phenotypes
+        for every combination of the given SNP1 and SNP2 Minor Allele Frequencies
+
+        Parameters
+        ----------
+        maf1: list of floats
+            Minor Allele Frequencies to use for SNP1
+        maf2: list of floats
+            Minor Allele Frequencies to use for SNP2
+        n_cases: int, default 1000
+        n_controls: int, default 1000
+        snr: float, default 1.0
+            Signal-to-noise ratio
+
+        Returns
+        -------
+        pd.Dataframe
+            Dataframe with 5 columns: MAF1, MAF2, Outcome (categorical), SNP1 (GenotypeArray), and SNP2 (GenotypeArray)
 
-        # Merge data together
-        snp1 = pd.concat([snp1_case_array, snp1_control_array]).reset_index(drop=True)
-        snp2 = pd.concat([snp2_case_array, snp2_control_array]).reset_index(drop=True)
+        """
+        # Validate params
+        if n_cases < 1 or n_controls < 0:
+            raise ValueError(
+                "Simulation must include at least one case and at least one control"
+            )
 
-        # Generate outcome
-        outcome = pd.Series(["Case"] * n_cases + ["Control"] * n_controls).astype(
-            "category"
+        # Probabilities and genotype counts for all MAF combinations at once
+        maf1_grid, maf2_grid = np.meshgrid(
+            np.asarray(maf1, dtype=float), np.asarray(maf2, dtype=float), indexing="ij"
+        )
+        maf1_grid = maf1_grid.ravel()
+        maf2_grid = maf2_grid.ravel()
+        prob_gt_given_case, prob_gt_given_control = self._get_case_control_probs(
+            maf1_grid, maf2_grid, snr
+        )
+        counts = np.concatenate(
+            [
+                self.rng.multinomial(n_cases, prob_gt_given_case),
+                self.rng.multinomial(n_controls, prob_gt_given_control),
+            ],
+            axis=1,
         )
-        result = pd.concat([outcome, snp1, snp2], axis=1)
-        result.columns = ["Outcome", "SNP1", "SNP2"]
 
-        # Scramble outcome so cases and controls are mixed
-        result = result.sample(frac=1, random_state=self._random_seed).reset_index(
-            drop=True
+        # Expand the counts into one code per sample for every MAF combination at once:
+        # 0-8 are cases and 9-17 are controls, each indexing into the genotype table.
+        # Samples are then scrambled within each MAF combination.
+        n_grid = len(counts)
+        sample_codes = np.repeat(
+            np.tile(np.arange(18, dtype=np.uint8), n_grid), counts.ravel()
+        ).reshape(n_grid, n_cases + n_controls)
+        sample_codes = self.rng.permuted(sample_codes, axis=1).ravel()
+        outcome_codes, gt_table_idxs = np.divmod(sample_codes, 9)
+        snp1, snp2 = self._get_gt_arrays(gt_table_idxs)
+
+        return pd.DataFrame(
+            {
+                "MAF1": np.repeat(maf1_grid, n_cases + n_controls),
+                "MAF2": np.repeat(maf2_grid, n_cases + n_controls),
+                "Outcome": pd.Categorical.from_codes(
+                    outcome_codes.astype(np.int8), dtype=_OUTCOME_DTYPE
+                ),
+                "SNP1": snp1,
+                "SNP2": snp2,
+            }
         )
 
-        return result
+    def generate_replicates(
+        self,
+        n_replicates: int = 10,
+        n_cases: int = 1000,
+        n_controls: int = 1000,
+        maf1: float = 0.30,
+        maf2: float = 0.30,
+        snr: Optional[float] = None,
+        n_jobs: int = -1,
+    ):
+        """
+        Simulate several independent case-control datasets in parallel.
+        Replicate `i` is generated using a random seed of `random_seed + i`.
+
+        Parameters
+        ----------
+        n_replicates: int, default 10
+        n_cases: int, default 1000
+        n_controls: int, default 1000
+        maf1: float, default 0.30
+            Minor Allele Frequency to use for SNP1
+        maf2: float, default 0.30
+            Minor Allele Frequency to use for SNP2
+        snr: float, default 1.0
+            Signal-to-noise ratio
+        n_jobs: int, default -1
+            Number of processes to use, or -1 to use all available CPUs
+
+        Returns
+        -------
+        pd.Dataframe
+            Dataframe with 4 columns: Replicate, Outcome (categorical), SNP1 (GenotypeArray), and SNP2 (GenotypeArray)
+
+        """
+        if n_replicates < 1:
+            raise ValueError("n_replicates must be >= 1")
+        if n_jobs == -1:
+            n_jobs = os.cpu_count()
+        elif n_jobs < 1:
+            raise ValueError("n_jobs must be -1 or >= 1")
+        n_jobs = min(n_jobs, n_replicates)
+
+        args = [
+            (self, rep, n_cases, n_controls, maf1, maf2, snr)
+            for rep in range(n_replicates)
+        ]
+        if n_jobs == 1:
+            replicates = [_generate_case_control_replicate(*a) for a in args]
+        else:
+            with Pool(n_jobs) as pool:
+                replicates = pool.starmap(_generate_case_control_replicate, args)
+
+        return pd.concat(replicates, ignore_index=True)
 
     def generate_quantitative(
         self,
@@ -376,27 +574,26 @@ class BAMS:
         """
         pen_table = self.pen_table
 
-        # Create table of Prob(GT) based on MAF, assuming HWE
-        prob_snp1 = np.array([(1 - maf1) ** 2, 2 * maf1 * (1 - maf1), (maf1) ** 2])
-        prob_snp2 = np.array(
-            [(1 - maf2) ** 2, 2 * maf2 * (1 - maf2), (maf2) ** 2]
-        ).transpose()
-        prob_gt = np.outer(prob_snp2, prob_snp1)
+        prob_gt = self._get_prob_gt(maf1, maf2)
 
         if snr is not None:
-            # Scale penetrance table from 0 to 1
-            pen_table = (pen_table - pen_table.min()) / (
-                pen_table.max() - pen_table.min()
-            )
+            # Use the penetrance table scaled from 0 to 1
+            pen_table = self._scaled_pen_table
             # Calculate sigma
             sigma = self._calculate_sigma(pen_table, prob_gt)
             # Scale the penetrance by the amount of unexplained variance
             pen_table = (pen_table / sigma) * snr
 
         # Generate genotypes
-        gt_table_idxs = self.rng.choice(range(9), size=n_samples, p=prob_gt.flatten())
-        snp1_array = pd.Series(self._get_snp1_gt_array(gt_table_idxs))
-        snp2_array = pd.Series(self._get_snp2_gt_array(gt_table_idxs))
+        # Searching float32 uniform draws against a 9-value float32 CDF is precise enough
+        cdf = np.cumsum(prob_gt).astype(np.float32)
+        cdf[-1] = 1.0
+        gt_table_idxs = np.searchsorted(
+            cdf, self.rng.random(n_samples, dtype=np.float32), side="right"
+        ).astype(np.uint8)
+        snp1_array, snp2_array = self._get_gt_arrays(gt_table_idxs)
+        snp1_array = pd.Series(snp1_array)
+        snp2_array = pd.Series(snp2_array)
 
         # Calculate outcome: Normal distribution with mean=probability and sd = 1
         outcome = pd.Series(
@@ -408,6 +605,64 @@ class BAMS:
 
         return result
 
+    @staticmethod
+    def _get_prob_gt(maf1, maf2):
+        """
+        Return Prob(GT) based on MAF, assuming HWE, for each genotype table cell
+        counted left to right (SNP1) then top to bottom (SNP2)
+
+        MAFs may be arrays, which are broadcast against each other with the table cells added as a final axis
+        """
+        maf1 = np.asarray(maf1, dtype=float)[..., None]
+        maf2 = np.asarray(maf2, dtype=float)[..., None]
+        prob_snp1 = np.concatenate(
+            [(1 - maf1) ** 2, 2 * maf1 * (1 - maf1), (maf1) ** 2], axis=-1
+        )
+        prob_snp2 = np.concatenate(
+            [(1 - maf2) ** 2, 2 * maf2 * (1 - maf2), (maf2) ** 2], axis=-1
+        )
+        prob_gt = prob_snp2[..., :, None] * prob_snp1[..., None, :]
+        return prob_gt.reshape(prob_gt.shape[:-2] + (9,))
+
+    def _get_case_control_probs(self, maf1, maf2, snr):
+        """
+        Return Prob(GT|Case) and Prob(GT|Control) for each genotype table cell
+
+        MAFs may be arrays, as in `_get_prob_gt`
+        """
+        prob_gt = self._get_prob_gt(maf1, maf2)
+
+        pen_table = self.pen_table.ravel()
+        if snr is not None:
+            # Use the penetrance table scaled from 0 to 1
+            pen_table = self._scaled_pen_table.ravel()
+            # Calcualte sigma for each set of genotype probabilities
+            sigma = np.array(
+                [self._calculate_sigma(pen_table, p) for p in prob_gt.reshape(-1, 9)]
+            ).reshape(prob_gt.shape[:-1] + (1,))
+            # Scale the penetrance by the amount of unexplained variance
+            # Odds Ratio = exp(SNP/Sigma)
+            min_p = 1 / (1 + np.exp(1 / sigma * snr))
+            p_diff = 1 - 2 * min_p
+            # Adjust the penetrance
+            pen_table = min_p + pen_table * p_diff
+
+        #                     P(Case|GT) * P(GT)
+        # Bayes: P(GT|Case) = ------------------
+        #                           P(Case)
+
+        # Prob(Case|GT) = pen_table
+        # Prob(Control|GT) = 1-pen_table, so Prob(Control|GT) * P(GT) = P(GT) - Prob(Case|GT) * P(GT)
+        prob_gt_given_case = pen_table * prob_gt
+        prob_gt_given_control = prob_gt - prob_gt_given_case
+
+        # Prob(Case) = sum(Prob(Case|GTi) * Prob(GTi) for each GT i)
+        prob_gt_given_case /= prob_gt_given_case.sum(axis=-1, keepdims=True)
+        # Prob(Control) = sum(Prob(Control|GTi) * Prob(GTi) for each GT i)
+        prob_gt_given_control /= prob_gt_given_control.sum(axis=-1, keepdims=True)
+
+        return prob_gt_given_case, prob_gt_given_control
+
     @staticmethod
     def _calculate_sigma(pen_table, prob_gt):
         # Set up a dataframe with the penetrance table outcome for each SNP combination (Encoded as codominant)
@@ -446,40 +701,24 @@ class BAMS:
             f"{variant.alt[0]}{variant.alt[0]}",
         ]
 
-    def _get_snp1_gt_array(self, gt_table_idxs):
-        """Assemble a GenotypeArray for SNP1 directly from genotype table indices"""
-        dtype = GenotypeDtype(self.snp1)
-        gt_table_data = (
-            ((0, 0), MISSING_IDX),
-            ((0, 1), MISSING_IDX),
-            ((1, 1), MISSING_IDX),
-            ((0, 0), MISSING_IDX),
-            ((0, 1), MISSING_IDX),
-            ((1, 1), MISSING_IDX),
-            ((0, 0), MISSING_IDX),
-            ((0, 1), MISSING_IDX),
-            ((1, 1), MISSING_IDX),
-        )
-        data = np.array(
-            [gt_table_data[i] for i in gt_table_idxs], dtype=dtype._record_type
-        )
-        return GenotypeArray(values=data, dtype=dtype)
-
-    def _get_snp2_gt_array(self, gt_table_idxs):
-        """Assemble a GenotypeArray for SNP2 directly from genotype table indices"""
-        dtype = GenotypeDtype(self.snp2)
-        gt_table_data = (
-            ((0, 0), MISSING_IDX),
-            ((0, 0), MISSING_IDX),
-            ((0, 0), MISSING_IDX),
-            ((0, 1), MISSING_IDX),
-            ((0, 1), MISSING_IDX),
-            ((0, 1), MISSING_IDX),
-            ((1, 1), MISSING_IDX),
-            ((1, 1), MISSING_IDX),
-            ((1, 1), MISSING_IDX),
-        )
-        data = np.array(
-            [gt_table_data[i] for i in gt_table_idxs], dtype=dtype._record_type
+    def _get_gt_arrays(self, gt_table_idxs):
+        """Assemble GenotypeArrays for SNP1 and SNP2 directly from genotype table indices"""
+        return (
+            GenotypeArray._from_allele_idxs(
+                _SNP1_ALLELE_IDXS[gt_table_idxs], dtype=self._snp1_dtype
+            ),
+            GenotypeArray._from_allele_idxs(
+                _SNP2_ALLELE_IDXS[gt_table_idxs], dtype=self._snp2_dtype
+            ),
         )
-        return GenotypeArray(values=data, dtype=dtype)
+
+
+def _generate_case_control_replicate(
+    simulator: BAMS, rep: int, n_cases, n_controls, maf1, maf2, snr
+):
+    """Generate one replicate using a copy of the simulator seeded for that replicate"""
+    simulator = copy.copy(simulator)
+    simulator.set_random_seed(simulator.random_seed + rep)
+    result = simulator.generate_case_control(n_cases, n_controls, maf1, maf2, snr)
+    result.insert(0, "Replicate", rep)
+    return result
@@ -274,7 +274,7 @@ def test_generated_encodings_plink(genotypearray_df):
                 main2=1,
                 interaction=0,
             ),
-            [0.934414, 1.397414],
+            [1.152217, 0.968335],
         ),
         (
             BAMS.from_model(
@@ -284,7 +284,7 @@ def test_generated_encodings_plink(genotypearray_df):
                 main2=1,
                 interaction=0,
             ),
-            [0.741167, 0.940075],
+            [0.849782, 0.702923],
         ),
         (
             BAMS.from_model(
@@ -294,7 +294,7 @@ def test_generated_encodings_plink(genotypearray_df):
                 main2=1,
                 interaction=0,
             ),
-            [0.525649, 0.608001],
+            [0.582969, 0.413039],
         ),
         (
             BAMS.from_model(
@@ -304,7 +304,7 @@ def test_generated_encodings_plink(genotypearray_df):
                 main2=1,
                 interaction=0,
             ),
-            [0.329229, 0.265553],
+            [0.300553, 0.202391],
         ),
         (
             BAMS.from_model(
@@ -314,7 +314,7 @@ def test_generated_encodings_plink(genotypearray_df):
                 main2=1,
                 interaction=0,
             ),
-            [-0.048920, 0.012398],
+            [-0.0053574, -0.021751],
         ),
     ],
 )
@@ -1,6 +1,8 @@
 """
 Test GenotypeDtype
 """
+import pickle
+
 import pandas as pd
 import pytest
 from pandas._testing import assert_series_equal, assert_extension_array_equal
@@ -78,3 +80,10 @@ def test_from_str(input_str, variant):
 def test_size(input_str, size):
     gtdtype = GenotypeDtype.construct_from_string(input_str)
     assert gtdtype.itemsize == size
+
+
+def test_pickle():
+    gtdtype = GenotypeDtype(TEST_VAR)
+    unpickled = pickle.loads(pickle.dumps(gtdtype))
+    assert unpickled == gtdtype
+    assert unpickled._record_type == gtdtype._record_type
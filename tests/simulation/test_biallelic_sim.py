@@ -1,4 +1,5 @@
 import numpy as np
+import pandas as pd
 import pytest
 from pandas._testing import assert_frame_equal
 
@@ -173,3 +174,69 @@ def test_null():
     # maf should be similar to the specified one despite a large fraction of cases
     # specifically assert it is within 5%
     assert abs(0.1 - simulated["SNP1"].genomics.maf) / 0.1 < 0.05
+
+
+def test_replicates():
+    bas = BAMS(PenetranceTables.XOR, random_seed=123)
+    replicates = bas.generate_replicates(3, 100, 50, n_jobs=2)
+    assert list(replicates.columns) == ["Replicate", "Outcome", "SNP1", "SNP2"]
+    assert (replicates["Replicate"].value_counts().sort_index() == 150).all()
+    # Each replicate matches a run with the corresponding seed
+    bas.set_random_seed(124)
+    expected = bas.generate_case_control(100, 50)
+    observed = replicates.loc[replicates["Replicate"] == 1].drop(columns="Replicate")
+    assert_frame_equal(observed.reset_index(drop=True), expected)
+    # Running in serial gives the same result
+    bas.set_random_seed(123)
+    assert_frame_equal(replicates, bas.generate_replicates(3, 100, 50, n_jobs=1))
+
+
+def test_case_control_outcome():
+    bas = BAMS(PenetranceTables.XOR)
+    simulated = bas.generate_case_control(300, 200)
+    assert list(simulated.columns) == ["Outcome", "SNP1", "SNP2"]
+    assert simulated["Outcome"].value_counts().to_dict() == {
+        "Case": 300,
+        "Control": 200,
+    }
+    # Cases and controls are mixed, and differently on each call
+    assert (simulated["Outcome"].iloc[:300] == "Control").any()
+    repeated = bas.generate_case_control(300, 200)
+    assert (simulated["Outcome"] != repeated["Outcome"]).any()
+
+
+def test_case_control_chunks():
+    bas = BAMS(PenetranceTables.XOR)
+    chunks = list(bas.iter_case_control_chunks(400, 1000, 500))
+    assert [len(c) for c in chunks] == [400, 400, 400, 300]
+    outcomes = pd.concat([c["Outcome"] for c in chunks])
+    assert outcomes.value_counts().to_dict() == {"Case": 1000, "Control": 500}
+    # Each chunk has cases and controls in proportion to the totals
+    assert (chunks[0]["Outcome"] == "Case").sum() in (266, 267)
+
+
+def test_case_control_grid():
+    bas = BAMS.from_model(SNPEffectEncodings.ADDITIVE, SNPEffectEncodings.ADDITIVE)
+    mafs1 = [0.1, 0.3, 0.5]
+    mafs2 = [0.2, 0.4]
+    grid = bas.generate_case_control_grid(mafs1, mafs2, 100, 50, snr=0.5)
+    assert list(grid.columns) == ["MAF1", "MAF2", "Outcome", "SNP1", "SNP2"]
+    cell_sizes = grid.groupby(["MAF1", "MAF2"]).size()
+    assert len(cell_sizes) == 6
+    assert (cell_sizes == 150).all()
+    # Probabilities for the grid match those calculated for each MAF pair
+    grid_probs = bas._get_case_control_probs(
+        np.repeat(mafs1, 2), np.tile(mafs2, 3), snr=0.5
+    )
+    for idx, (maf1, maf2) in enumerate(zip(np.repeat(mafs1, 2), np.tile(mafs2, 3))):
+        probs = bas._get_case_control_probs(maf1, maf2, snr=0.5)
+        assert np.allclose(grid_probs[0][idx], probs[0])
+        assert np.allclose(grid_probs[1][idx], probs[1])
+
+
+def test_default_pen_table():
+    """Modifying one simulator's penetrance table doesn't affect later defaults"""
+    bas = BAMS()
+    expected = bas.pen_table.copy()
+    bas.pen_table[0, 0] = 1.0
+    assert np.array_equal(BAMS().pen_table, expected)